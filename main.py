@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-import random
+import json
+import os
+import secrets
 import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
+import numpy as np
 from PIL import Image
-from PyQt5.QtCore import QObject, Qt, QThread, QTimer, QEvent, QPointF, pyqtSignal
-from PyQt5.QtGui import QColor, QIcon, QImage, QPalette, QPixmap, QWheelEvent
+from PyQt5.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QEvent,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QColor, QIcon, QImage, QPalette, QPixmap
 from PyQt5.QtWidgets import (
     QAbstractScrollArea,
     QAbstractSpinBox,
@@ -20,7 +38,6 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLayout,
-    QListView,
     QFrame,
     QLabel,
     QLineEdit,
@@ -38,7 +55,8 @@ from PyQt5.QtWidgets import (
 )
 
 from settings_manager import DEFAULT_SETTINGS_PATH, PersistedSettings, SettingsManager
-from thumbnail_generator import ThumbnailGenerator, ThumbnailSettings
+from thumbnail_generator import PreviewCancelled, ThumbnailGenerator, ThumbnailSettings
+from video_processor import VideoInfo
 from watermark_manager import WatermarkSettings
 
 
@@ -52,125 +70,82 @@ def resource_path(relative: str) -> Path:
 
 APP_ICON_PATH = "assets/icon.ico"
 
-
-def pil_to_pixmap(image: Image.Image) -> QPixmap:
-    """Convert a PIL image into a QPixmap for preview rendering."""
-    if image.mode != "RGBA":
+# Probed video metadata persists here so re-opening a file skips ffprobe.
+VIDEOINFO_CACHE_PATH = Path.home() / ".imago_videoinfo.json"
+VIDEOINFO_CACHE_SIZE = 64
+
+# Debounce windows (ms) per trigger class; discrete controls additionally get
+# a leading-edge render when nothing is pending.
+PREVIEW_DEBOUNCE_MS = {
+    "discrete": 80,
+    "numeric": 200,
+    "text": 500,
+    "drag": 400,
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_ms(ms: int) -> str:
+    """Format integer milliseconds as MM:SS.ss; cached since scrubbing
+    re-formats the same values repeatedly. Pure integer arithmetic — no
+    float round-trip on the slider path."""
+    if ms < 0:
+        ms = 0
+    minutes, rem = divmod(ms, 60_000)
+    seconds, centis = divmod(rem // 10, 100)
+    return f"{minutes:02d}:{seconds:02d}.{centis:02d}"
+
+# Pillow-SIMD is a drop-in replacement whose AVX2 builds of convert/resize/
+# alpha_composite speed up the render pipeline with no code changes; its
+# version strings carry a ".postN" suffix (e.g. "9.0.0.post1").
+PILLOW_SIMD_ACTIVE = ".post" in getattr(Image, "__version__", "")
+
+
+# Direct PIL-mode -> QImage-format dispatch for the two modes the pipeline
+# produces; anything else converts to RGBA first.
+_QIMAGE_FORMATS = {
+    "RGB": QImage.Format_RGB888,
+    "RGBA": QImage.Format_RGBA8888,
+}
+
+
+def pil_to_qimage(image: Image.Image) -> QImage:
+    """Convert a PIL image into a QImage.
+
+    Safe to call from worker threads — QImage, unlike QPixmap, carries no
+    GUI-thread affinity.
+    """
+    # The composed output is usually opaque RGB; skip the RGBA expansion and
+    # ship 3 bytes/pixel straight through in that case.
+    image_format = _QIMAGE_FORMATS.get(image.mode)
+    if image_format is None:
         image = image.convert("RGBA")
-    data = image.tobytes("raw", "RGBA")
-    bytes_per_line = image.width * 4
+        image_format = QImage.Format_RGBA8888
+    # numpy views the PIL buffer via __array_interface__ in one contiguous
+    # pass, avoiding tobytes()'s chunked encode-and-join. PIL exports are
+    # normally already C-contiguous, so the extra copy here is the rare case.
+    arr = np.asarray(image)
+    if not arr.flags["C_CONTIGUOUS"]:
+        arr = np.ascontiguousarray(arr)
     qimage = QImage(
-        data, image.width, image.height, bytes_per_line, QImage.Format_RGBA8888
+        arr.data, image.width, image.height, arr.strides[0], image_format
     )
-    # Copy to detach from the temporary memory buffer
-    return QPixmap.fromImage(qimage.copy())
-
-
-class ThumbnailWorker(QObject):
-    progress_changed = pyqtSignal(int)
-    finished = pyqtSignal(str, QPixmap)
-    error = pyqtSignal(str)
-
-    def __init__(
-        self,
-        video_path: Path,
-        thumbnail_settings: ThumbnailSettings,
-        watermark_settings: WatermarkSettings,
-    ) -> None:
-        super().__init__()
-        self.video_path = Path(video_path)
-        self.thumbnail_settings = thumbnail_settings
-        self.watermark_settings = watermark_settings
-
-    def run(self) -> None:
-        try:
-            generator = ThumbnailGenerator(self.video_path)
-            output_path, image = generator.generate(
-                self.thumbnail_settings,
-                self.watermark_settings,
-                progress_callback=self.progress_changed.emit,
-            )
-            pixmap = pil_to_pixmap(image)
-            self.finished.emit(str(output_path), pixmap)
-        except Exception as exc:  # pragma: no cover - GUI error handling
-            self.error.emit(str(exc))
-
-
-class PreviewWorker(QObject):
-    finished = pyqtSignal(QPixmap)
-    error = pyqtSignal(str)
+    # The constructed QImage aliases the array's memory, and a queued
+    # cross-thread emit copies only the C++ QImage — not the Python wrapper
+    # keeping the array alive — so the GUI thread would read freed memory
+    # once run() returns. Detach into QImage-owned storage before handing
+    # the image anywhere; one memcpy is trivial next to the render cost.
+    return qimage.copy()
 
-    def __init__(
-        self,
-        video_path: Path,
-        thumbnail_settings: ThumbnailSettings,
-        watermark_settings: WatermarkSettings,
-    ) -> None:
-        super().__init__()
-        self.video_path = Path(video_path)
-        self.thumbnail_settings = thumbnail_settings
-        self.watermark_settings = watermark_settings
-
-    def run(self) -> None:
-        try:
-            generator = ThumbnailGenerator(self.video_path)
-            image = generator.render_image(
-                self.thumbnail_settings,
-                self.watermark_settings,
-            )
-            pixmap = pil_to_pixmap(image)
-            self.finished.emit(pixmap)
-        except Exception as exc:  # pragma: no cover - GUI error handling
-            self.error.emit(str(exc))
-
-
-class HoverScrollBlocker(QObject):
-    """Prevents accidental value changes from scroll-wheel hover."""
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Wheel:
-            allow = bool(obj.hasFocus())
-            parent = obj.parent()
-            if not allow and isinstance(parent, QWidget):
-                allow = parent.hasFocus()
-            if isinstance(obj, QComboBox):
-                view = obj.view()
-                if view and view.isVisible():
-                    allow = True
-            if not allow:
-                parent = obj.parent()
-                while parent and not isinstance(parent, QAbstractScrollArea):
-                    parent = parent.parent()
-                if isinstance(parent, QAbstractScrollArea):
-                    mapped = obj.mapTo(parent.viewport(), event.pos())
-                    global_pos = (
-                        event.globalPosition()
-                        if hasattr(event, "globalPosition")
-                        else QPointF(event.globalPos())
-                    )
-                    phase = event.phase() if hasattr(event, "phase") else Qt.NoScrollPhase
-                    inverted = event.inverted() if hasattr(event, "inverted") else False
-                    clone = QWheelEvent(
-                        QPointF(mapped),
-                        global_pos,
-                        event.pixelDelta(),
-                        event.angleDelta(),
-                        event.buttons(),
-                        event.modifiers(),
-                        phase,
-                        inverted,
-                    )
-                    QApplication.sendEvent(parent.viewport(), clone)
-                return True
-        return super().eventFilter(obj, event)
+def qimage_to_pixmap(qimage: QImage) -> QPixmap:
+    """GUI-thread half of the conversion: wrap a QImage in a QPixmap."""
+    return QPixmap.fromImage(qimage)
 
 
-class MainWindow(QMainWindow):
-    RESIZE_PRESETS = [
-        ("YouTube Thumbnail (1280 x 720)", (1280, 720)),
-        ("Twitter Card (640 x 360)", (640, 360)),
-    ]
-    APP_STYLE = """
+# Parsed once and applied at the application level in main(); Qt caches the
+# resulting style tree and cascades it to every widget, including combo popups.
+APP_STYLE = """
     QMainWindow {
         background-color: #f3f4f6;
         color: #1f2933;
@@ -395,11 +370,217 @@ class MainWindow(QMainWindow):
     }
     """
 
+class ThumbnailWorkerSignals(QObject):
+    progress_changed = pyqtSignal(int)
+    finished = pyqtSignal(str, QImage)
+    error = pyqtSignal(str)
+
+
+class ThumbnailWorker(QRunnable):
+    def __init__(
+        self,
+        video_path: Path,
+        thumbnail_settings: ThumbnailSettings,
+        watermark_settings: WatermarkSettings,
+    ) -> None:
+        super().__init__()
+        self.video_path = video_path if isinstance(video_path, Path) else Path(video_path)
+        self.thumbnail_settings = thumbnail_settings
+        self.watermark_settings = watermark_settings
+        self.signals = ThumbnailWorkerSignals()
+        self._last_progress_emit = 0.0
+
+    def _emit_progress(self, percent: int) -> None:
+        # Each cross-thread emit queues an event on the GUI loop; cap at
+        # ~20 Hz so 100-cell grids do not flood it, but always deliver 100%.
+        now = time.monotonic()
+        if percent >= 100 or now - self._last_progress_emit >= 0.05:
+            self._last_progress_emit = now
+            self.signals.progress_changed.emit(percent)
+
+    def run(self) -> None:
+        try:
+            generator = ThumbnailGenerator(self.video_path)
+            output_path, image = generator.generate(
+                self.thumbnail_settings,
+                self.watermark_settings,
+                progress_callback=self._emit_progress,
+            )
+            qimage = pil_to_qimage(image)
+            self.signals.finished.emit(str(output_path), qimage)
+        except Exception as exc:  # pragma: no cover - GUI error handling
+            self.signals.error.emit(str(exc))
+
+
+class VideoInfoWorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    # Carries the probed video path so stale results can be recognized.
+    error = pyqtSignal(object, str)
+
+
+class VideoInfoWorker(QRunnable):
+    """Probes video metadata off the GUI thread (ffprobe can take ~100 ms+)."""
+
+    def __init__(self, generator: ThumbnailGenerator) -> None:
+        super().__init__()
+        self.generator = generator
+        self.signals = VideoInfoWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            self.signals.finished.emit(self.generator.get_video_info())
+        except Exception as exc:  # pragma: no cover - GUI error handling
+            self.signals.error.emit(self.generator.video_path, str(exc))
+
+
+class PreviewWorkerSignals(QObject):
+    # First argument carries the cache key (tuple or None) for the image.
+    finished = pyqtSignal(object, QImage)
+    error = pyqtSignal(str)
+
+
+class PreviewWorker(QRunnable):
+    """Long-lived runnable re-armed with fresh inputs for each preview.
+
+    A single instance is re-submitted to the pool instead of allocating a
+    QRunnable + signals QObject per tick; run() drains the latest pending
+    inputs so bursts collapse into one render.
+    """
+
+    def __init__(
+        self,
+        generator_lock: threading.Lock,
+        current_generation: Callable[[], int],
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.generator_lock = generator_lock
+        self._current_generation = current_generation
+        self._inputs_lock = threading.Lock()
+        self._pending: Optional[tuple] = None
+        self._queued = False
+        self.signals = PreviewWorkerSignals()
+
+    def set_inputs(
+        self,
+        generator: ThumbnailGenerator,
+        thumbnail_settings: ThumbnailSettings,
+        watermark_settings: WatermarkSettings,
+        generation: int,
+        max_dim: Optional[Tuple[int, int]],
+        cache_key: Optional[tuple],
+    ) -> bool:
+        """Stage the next render; returns True if the caller must submit."""
+        with self._inputs_lock:
+            self._pending = (
+                generator,
+                thumbnail_settings,
+                watermark_settings,
+                generation,
+                max_dim,
+                cache_key,
+            )
+            if self._queued:
+                return False
+            self._queued = True
+            return True
+
+    def run(self) -> None:
+        while True:
+            with self._inputs_lock:
+                if self._pending is None:
+                    self._queued = False
+                    return
+                (
+                    generator,
+                    thumbnail_settings,
+                    watermark_settings,
+                    generation,
+                    max_dim,
+                    cache_key,
+                ) = self._pending
+                self._pending = None
+            try:
+                # The generator lives for the whole video selection; serialize
+                # access since it is not guaranteed thread-safe.
+                with self.generator_lock:
+                    image = generator.render_image(
+                        thumbnail_settings,
+                        watermark_settings,
+                        max_dim=max_dim,
+                        should_cancel=lambda: generation != self._current_generation(),
+                    )
+            except PreviewCancelled:
+                continue
+            except Exception as exc:  # pragma: no cover - GUI error handling
+                if generation == self._current_generation():
+                    self.signals.error.emit(str(exc))
+                continue
+            if generation != self._current_generation():
+                continue
+            try:
+                qimage = pil_to_qimage(image)
+                self.signals.finished.emit(cache_key, qimage)
+            except Exception as exc:  # pragma: no cover - GUI error handling
+                # An escape here would leave _queued set and wedge the
+                # runnable for the rest of the session.
+                self.signals.error.emit(str(exc))
+
+
+class HoverScrollBlocker(QObject):
+    """Prevents accidental value changes from scroll-wheel hover."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        # Nearest scroll area per watched widget, resolved once at install
+        # time instead of walking the widget tree per wheel event.
+        self._scroll_parents: "weakref.WeakKeyDictionary[QWidget, Optional[QAbstractScrollArea]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def register(self, widget: QWidget) -> None:
+        parent = widget.parent()
+        while parent and not isinstance(parent, QAbstractScrollArea):
+            parent = parent.parent()
+        self._scroll_parents[widget] = (
+            parent if isinstance(parent, QAbstractScrollArea) else None
+        )
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel:
+            allow = bool(obj.hasFocus())
+            parent = obj.parent()
+            if not allow and isinstance(parent, QWidget):
+                allow = parent.hasFocus()
+            if isinstance(obj, QComboBox):
+                view = obj.view()
+                if view and view.isVisible():
+                    allow = True
+            if not allow:
+                try:
+                    scroll_area = self._scroll_parents[obj]
+                except KeyError:
+                    self.register(obj)
+                    scroll_area = self._scroll_parents[obj]
+                if scroll_area is not None:
+                    # Forward the original event; Qt re-routes coordinates for
+                    # scrolling, so no QWheelEvent clone is needed.
+                    QApplication.sendEvent(scroll_area.viewport(), event)
+                return True
+        return super().eventFilter(obj, event)
+
+
+class MainWindow(QMainWindow):
+    PREVIEW_CACHE_SIZE = 16
+    RESIZE_PRESETS = [
+        ("YouTube Thumbnail (1280 x 720)", (1280, 720)),
+        ("Twitter Card (640 x 360)", (640, 360)),
+    ]
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Imago | Thumbnail Generator ")
         self.resize(960, 720)
-        self.setStyleSheet(self.APP_STYLE)
         icon_path = resource_path(APP_ICON_PATH)
         if icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
@@ -418,17 +599,42 @@ class MainWindow(QMainWindow):
         self.selected_color = "#FFFFFF"
         self.selected_font_path: Optional[Path] = None
         self.current_pixmap: Optional[QPixmap] = None
-        self.worker_thread: Optional[QThread] = None
         self.worker: Optional[ThumbnailWorker] = None
+        self._generator: Optional[ThumbnailGenerator] = None
+        self._generator_lock = threading.Lock()
+        self._video_info_worker: Optional[VideoInfoWorker] = None
+        self._videoinfo_cache: Optional[dict] = None
         self.random_seed: Optional[int] = None
-        self.preview_worker_thread: Optional[QThread] = None
-        self.preview_worker: Optional[PreviewWorker] = None
-        self.preview_needs_refresh = False
+        self._preview_generation = 0
+        self._last_preview_dispatch = 0.0
+        self._preview_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._last_rendered_key: Optional[tuple] = None
+        self._last_smooth_key: Optional[tuple] = None
+        self._display_pixmap: Optional[QPixmap] = None
+        self._label_shows_smooth = False
+        self._thread_pool = QThreadPool.globalInstance()
+        self._thread_pool.setMaxThreadCount(max(2, self._thread_pool.maxThreadCount()))
+        self._preview_runnable = PreviewWorker(
+            self._generator_lock, lambda: self._preview_generation
+        )
+        self._preview_runnable.signals.finished.connect(self._on_preview_ready)
+        self._preview_runnable.signals.error.connect(self._on_preview_error)
         self.video_duration: float = 0.0
-        self._syncing_timestamp = False
+        self._video_stat_cache: Tuple[float, bool] = (0.0, False)
+        # Cached combo selections; refreshed on currentIndexChanged so the
+        # hot gather paths avoid repeated Qt string marshalling.
+        self._watermark_kind = "none"
+        self._position = "center"
+        self._output_format = "jpg"
+        self._output_path_key: Optional[tuple] = None
+        self._output_path_cache = Path("thumbnail.jpg")
+        self._dragging = False
+        self._previews_suspended = False
+        self._update_batch_depth = 0
         self.timestamp_slider_label: Optional[QLabel] = None
         self.sidebar_scroll: Optional[QScrollArea] = None
         self.controls_container: Optional[QWidget] = None
+        self._synced_sidebar_width = -1
         self._wheel_guard = HoverScrollBlocker(self)
 
         self.preview_timer = QTimer(self)
@@ -436,7 +642,20 @@ class MainWindow(QMainWindow):
         self.preview_timer.setInterval(400)
         self.preview_timer.timeout.connect(self._start_preview_worker)
 
+        # Upgrades a fast-scaled preview to a smooth rescale once idle.
+        self._smooth_upgrade_timer = QTimer(self)
+        self._smooth_upgrade_timer.setSingleShot(True)
+        self._smooth_upgrade_timer.setInterval(150)
+        self._smooth_upgrade_timer.timeout.connect(self._refresh_preview_smooth)
+
+        # Coalesces the storm of resizeEvents during a window drag.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(60)
+        self._resize_timer.timeout.connect(self._refresh_preview_smooth)
+
         self._build_ui()
+        self._refresh_combo_caches()
         self._connect_signals()
         self._install_scroll_wheel_guards()
 
@@ -605,67 +824,30 @@ class MainWindow(QMainWindow):
         watermark_form.addRow("Position", self.position_combo)
         self.position_label = watermark_form.labelForField(self.position_combo)
 
-        # Text watermark elements
-        self.watermark_text_line = QLineEdit()
-        watermark_form.addRow("Text", self.watermark_text_line)
-        self.watermark_text_label = watermark_form.labelForField(self.watermark_text_line)
-
-        font_layout = QHBoxLayout()
-        self.font_path_display = QLineEdit()
-        self.font_path_display.setReadOnly(True)
-        self.font_path_display.setPlaceholderText("Default font")
-        self.font_browse_btn = QPushButton("Choose Font…")
-        font_layout.addWidget(self.font_path_display, stretch=1)
-        font_layout.addWidget(self.font_browse_btn)
-        font_container = QWidget()
-        font_container.setLayout(font_layout)
-        watermark_form.addRow("Font", font_container)
-        self.font_container = font_container
-        self.font_container_label = watermark_form.labelForField(font_container)
-
-        self.font_size_spin = QSpinBox()
-        self.font_size_spin.setRange(8, 200)
-        self.font_size_spin.setValue(48)
-        watermark_form.addRow("Font Size", self.font_size_spin)
-        self.font_size_label = watermark_form.labelForField(self.font_size_spin)
-
-        color_layout = QHBoxLayout()
-        self.color_preview = QLabel("      ")
-        self.color_preview.setStyleSheet("background-color: #FFFFFF; border: 1px solid #444;")
-        self.color_button = QPushButton("Choose Color…")
-        color_layout.addWidget(self.color_preview)
-        color_layout.addWidget(self.color_button)
-        color_container = QWidget()
-        color_container.setLayout(color_layout)
-        watermark_form.addRow("Color", color_container)
-        self.color_container = color_container
-        self.color_label = watermark_form.labelForField(color_container)
-
-        # Image watermark elements
-        image_layout = QHBoxLayout()
-        self.watermark_image_line = QLineEdit()
-        self.watermark_image_line.setReadOnly(True)
-        self.watermark_image_browse = QPushButton("Select Image…")
-        image_layout.addWidget(self.watermark_image_line, stretch=1)
-        image_layout.addWidget(self.watermark_image_browse)
-        image_container = QWidget()
-        image_container.setLayout(image_layout)
-        watermark_form.addRow("Image", image_container)
-        self.image_container = image_container
-        self.image_container_label = watermark_form.labelForField(image_container)
-
-        self.image_scale_slider = QSlider(Qt.Horizontal)
-        self.image_scale_slider.setRange(5, 100)
-        self.image_scale_slider.setValue(30)
-        self.image_scale_label = QLabel("30% width")
-        scale_layout = QHBoxLayout()
-        scale_layout.addWidget(self.image_scale_slider)
-        scale_layout.addWidget(self.image_scale_label)
-        scale_container = QWidget()
-        scale_container.setLayout(scale_layout)
-        watermark_form.addRow("Scale", scale_container)
-        self.scale_container = scale_container
-        self.scale_container_label = watermark_form.labelForField(scale_container)
+        # Text/image watermark rows are built lazily the first time their
+        # type is selected (or settings referencing them are loaded); the
+        # default "None" start-up path never pays for those ~15 widgets.
+        self.watermark_form = watermark_form
+        self.watermark_text_line: Optional[QLineEdit] = None
+        self.watermark_text_label: Optional[QLabel] = None
+        self.font_path_display: Optional[QLineEdit] = None
+        self.font_browse_btn: Optional[QPushButton] = None
+        self.font_container: Optional[QWidget] = None
+        self.font_container_label: Optional[QLabel] = None
+        self.font_size_spin: Optional[QSpinBox] = None
+        self.font_size_label: Optional[QLabel] = None
+        self.color_preview: Optional[QLabel] = None
+        self.color_button: Optional[QPushButton] = None
+        self.color_container: Optional[QWidget] = None
+        self.color_label: Optional[QLabel] = None
+        self.watermark_image_line: Optional[QLineEdit] = None
+        self.watermark_image_browse: Optional[QPushButton] = None
+        self.image_container: Optional[QWidget] = None
+        self.image_container_label: Optional[QLabel] = None
+        self.image_scale_slider: Optional[QSlider] = None
+        self.image_scale_label: Optional[QLabel] = None
+        self.scale_container: Optional[QWidget] = None
+        self.scale_container_label: Optional[QLabel] = None
 
         watermark_group.setLayout(watermark_form)
         controls_layout.addWidget(watermark_group)
@@ -684,8 +866,10 @@ class MainWindow(QMainWindow):
 
         self.resize_combo = QComboBox()
         self.resize_combo.setEnabled(False)
-        for label, size in self.RESIZE_PRESETS:
+        self._resize_preset_index = {}
+        for idx, (label, size) in enumerate(self.RESIZE_PRESETS):
             self.resize_combo.addItem(label, size)
+            self._resize_preset_index[tuple(size)] = idx
         output_form.addRow("Size Preset", self.resize_combo)
         self.resize_combo_label = output_form.labelForField(self.resize_combo)
 
@@ -716,47 +900,145 @@ class MainWindow(QMainWindow):
         controls_layout.addWidget(self.generate_btn)
         controls_layout.addWidget(self.progress_bar)
 
+        # Sliders commit their value on release; labels track the drag via
+        # sliderMoved so the UI still feels live without per-tick renders.
+        for slider in (self.timestamp_slider, self.opacity_slider):
+            slider.setTracking(False)
+
         self._apply_combo_popup_styles()
 
         controls_layout.addStretch(1)
         self._update_mode_controls()
         self._update_watermark_controls()
         self._on_resize_toggled(self.resize_checkbox.isChecked())
-        self._sync_sidebar_width()
+        # One deferred pass once layout settles; the synchronous call here
+        # only duplicated the full sizeHint traversal.
         QTimer.singleShot(0, self._sync_sidebar_width)
 
+    def _ensure_text_watermark_rows(self) -> None:
+        if self.watermark_text_line is not None:
+            return
+        form = self.watermark_form
+
+        self.watermark_text_line = QLineEdit()
+        form.addRow("Text", self.watermark_text_line)
+        self.watermark_text_label = form.labelForField(self.watermark_text_line)
+
+        font_layout = QHBoxLayout()
+        self.font_path_display = QLineEdit()
+        self.font_path_display.setReadOnly(True)
+        self.font_path_display.setPlaceholderText("Default font")
+        self.font_browse_btn = QPushButton("Choose Font…")
+        font_layout.addWidget(self.font_path_display, stretch=1)
+        font_layout.addWidget(self.font_browse_btn)
+        font_container = QWidget()
+        font_container.setLayout(font_layout)
+        form.addRow("Font", font_container)
+        self.font_container = font_container
+        self.font_container_label = form.labelForField(font_container)
+
+        self.font_size_spin = QSpinBox()
+        self.font_size_spin.setRange(8, 200)
+        self.font_size_spin.setValue(48)
+        form.addRow("Font Size", self.font_size_spin)
+        self.font_size_label = form.labelForField(self.font_size_spin)
+
+        color_layout = QHBoxLayout()
+        self.color_preview = QLabel("      ")
+        self.color_preview.setStyleSheet(
+            f"background-color: {self.selected_color}; border: 1px solid #444;"
+        )
+        self.color_button = QPushButton("Choose Color…")
+        color_layout.addWidget(self.color_preview)
+        color_layout.addWidget(self.color_button)
+        color_container = QWidget()
+        color_container.setLayout(color_layout)
+        form.addRow("Color", color_container)
+        self.color_container = color_container
+        self.color_label = form.labelForField(color_container)
+
+        self.watermark_text_line.textChanged.connect(self._on_watermark_text_changed)
+        self.watermark_text_line.editingFinished.connect(self._on_watermark_text_committed)
+        self.font_size_spin.valueChanged.connect(self._schedule_numeric)
+        self.font_browse_btn.clicked.connect(self._choose_font)
+        self.color_button.clicked.connect(self._choose_color)
+        self._guard_wheel(self.font_size_spin)
+        self._sync_sidebar_width()
+
+    def _ensure_image_watermark_rows(self) -> None:
+        if self.watermark_image_line is not None:
+            return
+        form = self.watermark_form
+
+        image_layout = QHBoxLayout()
+        self.watermark_image_line = QLineEdit()
+        self.watermark_image_line.setReadOnly(True)
+        self.watermark_image_browse = QPushButton("Select Image…")
+        image_layout.addWidget(self.watermark_image_line, stretch=1)
+        image_layout.addWidget(self.watermark_image_browse)
+        image_container = QWidget()
+        image_container.setLayout(image_layout)
+        form.addRow("Image", image_container)
+        self.image_container = image_container
+        self.image_container_label = form.labelForField(image_container)
+
+        self.image_scale_slider = QSlider(Qt.Horizontal)
+        self.image_scale_slider.setRange(5, 100)
+        self.image_scale_slider.setValue(30)
+        self.image_scale_slider.setTracking(False)
+        self.image_scale_label = QLabel("30% width")
+        scale_layout = QHBoxLayout()
+        scale_layout.addWidget(self.image_scale_slider)
+        scale_layout.addWidget(self.image_scale_label)
+        scale_container = QWidget()
+        scale_container.setLayout(scale_layout)
+        form.addRow("Scale", scale_container)
+        self.scale_container = scale_container
+        self.scale_container_label = form.labelForField(scale_container)
+
+        self.watermark_image_browse.clicked.connect(self._choose_watermark_image)
+        self.image_scale_slider.valueChanged.connect(self._on_scale_changed)
+        self.image_scale_slider.sliderMoved.connect(self._on_scale_moved)
+        self.image_scale_slider.sliderPressed.connect(self._on_slider_pressed)
+        self.image_scale_slider.sliderReleased.connect(self._on_slider_released)
+        self._sync_sidebar_width()
+
+    def _guard_wheel(self, widget: QWidget) -> None:
+        widget.installEventFilter(self._wheel_guard)
+        self._wheel_guard.register(widget)
+        if isinstance(widget, (QComboBox, QAbstractSpinBox)):
+            widget.setFocusPolicy(Qt.StrongFocus)
+        editor = None
+        if isinstance(widget, QAbstractSpinBox):
+            editor = widget.lineEdit()
+        elif isinstance(widget, QComboBox) and widget.isEditable():
+            editor = widget.lineEdit()
+        if editor:
+            editor.installEventFilter(self._wheel_guard)
+            self._wheel_guard.register(editor)
+
     def _install_scroll_wheel_guards(self) -> None:
-        targets = [
-            getattr(self, "mode_combo", None),
-            getattr(self, "watermark_type_combo", None),
-            getattr(self, "position_combo", None),
-            getattr(self, "output_format_combo", None),
-            getattr(self, "resize_combo", None),
-            getattr(self, "timestamp_spin", None),
-            getattr(self, "rows_spin", None),
-            getattr(self, "cols_spin", None),
-            getattr(self, "font_size_spin", None),
-        ]
+        # All of these exist once _build_ui has run; no getattr fallbacks.
+        targets = (
+            self.mode_combo,
+            self.watermark_type_combo,
+            self.position_combo,
+            self.output_format_combo,
+            self.resize_combo,
+            self.timestamp_spin,
+            self.rows_spin,
+            self.cols_spin,
+        )
         for widget in targets:
-            if widget:
-                widget.installEventFilter(self._wheel_guard)
-                if isinstance(widget, (QComboBox, QAbstractSpinBox)):
-                    widget.setFocusPolicy(Qt.StrongFocus)
-                if isinstance(widget, QAbstractSpinBox):
-                    editor = widget.lineEdit()
-                    if editor:
-                        editor.installEventFilter(self._wheel_guard)
-                if isinstance(widget, QComboBox) and widget.isEditable():
-                    editor = widget.lineEdit()
-                    if editor:
-                        editor.installEventFilter(self._wheel_guard)
+            self._guard_wheel(widget)
 
     def _sync_sidebar_width(self) -> None:
         if not self.sidebar_scroll or not self.controls_container:
             return
         content_width = self.controls_container.sizeHint().width()
-        if content_width <= 0:
+        if content_width <= 0 or content_width == self._synced_sidebar_width:
             return
+        self._synced_sidebar_width = content_width
         self.controls_container.setMinimumWidth(content_width)
         scrollbar_width = self.sidebar_scroll.verticalScrollBar().sizeHint().width()
         frame_width = self.sidebar_scroll.frameWidth() * 2
@@ -764,31 +1046,8 @@ class MainWindow(QMainWindow):
         self.sidebar_scroll.setMinimumWidth(target_width)
 
     def _apply_combo_popup_styles(self) -> None:
-        popup_style = """
-            QListView {
-                background-color: #ffffff;
-                border: 1px solid #cbd5f5;
-                border-radius: 8px;
-                color: #1f2933;
-                padding: 4px 0;
-                outline: none;
-                selection-background-color: #dbeafe;
-                selection-color: #1e3a8a;
-            }
-            QListView::item {
-                background-color: #ffffff;
-                color: #1f2933;
-                padding: 6px 12px;
-            }
-            QListView::item:hover {
-                background-color: #e0f2fe;
-                color: #1d4ed8;
-            }
-            QListView::item:selected {
-                background-color: #dbeafe;
-                color: #1e3a8a;
-            }
-        """
+        # Styling comes from the app-wide stylesheet; popups only need their
+        # palettes forced so native views do not fall back to system colors.
         combos = [
             self.mode_combo,
             self.watermark_type_combo,
@@ -798,10 +1057,6 @@ class MainWindow(QMainWindow):
         ]
         for combo in combos:
             view = combo.view()
-            if isinstance(view, QListView):
-                view.setStyleSheet(popup_style)
-            else:
-                view.viewport().setStyleSheet(popup_style)
             palette = view.palette()
             palette.setColor(QPalette.Base, QColor("#ffffff"))
             palette.setColor(QPalette.Text, QColor("#1f2933"))
@@ -812,15 +1067,29 @@ class MainWindow(QMainWindow):
             view.setAutoFillBackground(True)
             view.viewport().setAutoFillBackground(True)
 
+    def _refresh_combo_caches(self) -> None:
+        self._watermark_kind = self.watermark_type_combo.currentText().lower()
+        self._position = self.position_combo.currentText()
+        self._output_format = self.output_format_combo.currentText().lower()
+
+    def _on_watermark_kind_changed(self, index: int) -> None:
+        self._watermark_kind = self.watermark_type_combo.itemText(index).lower()
+
+    def _on_position_changed(self, index: int) -> None:
+        self._position = self.position_combo.itemText(index)
+
+    def _on_output_format_changed(self, index: int) -> None:
+        self._output_format = self.output_format_combo.itemText(index).lower()
+
     def _connect_signals(self) -> None:
+        # Cache updaters connect first so downstream slots read fresh values.
+        self.watermark_type_combo.currentIndexChanged.connect(self._on_watermark_kind_changed)
+        self.position_combo.currentIndexChanged.connect(self._on_position_changed)
+        self.output_format_combo.currentIndexChanged.connect(self._on_output_format_changed)
         self.video_browse_btn.clicked.connect(self._select_video)
         self.mode_combo.currentIndexChanged.connect(self._update_mode_controls)
         self.watermark_type_combo.currentIndexChanged.connect(self._update_watermark_controls)
         self.opacity_slider.valueChanged.connect(self._on_opacity_changed)
-        self.image_scale_slider.valueChanged.connect(self._on_scale_changed)
-        self.color_button.clicked.connect(self._choose_color)
-        self.font_browse_btn.clicked.connect(self._choose_font)
-        self.watermark_image_browse.clicked.connect(self._choose_watermark_image)
         self.output_path_browse.clicked.connect(self._select_output_file)
         self.generate_btn.clicked.connect(self._generate_thumbnail)
         self.save_settings_btn.clicked.connect(self._save_settings)
@@ -829,28 +1098,136 @@ class MainWindow(QMainWindow):
         self.timestamp_spin.valueChanged.connect(self._on_timestamp_spin_changed)
         self.resize_checkbox.toggled.connect(self._on_resize_toggled)
         self.resize_combo.currentIndexChanged.connect(self._on_resize_combo_changed)
+        for slider in (self.opacity_slider, self.timestamp_slider):
+            slider.sliderPressed.connect(self._on_slider_pressed)
+            slider.sliderReleased.connect(self._on_slider_released)
+        self.timestamp_slider.sliderMoved.connect(self._on_timestamp_slider_moved)
+        self.opacity_slider.sliderMoved.connect(self._on_opacity_moved)
         self._register_preview_triggers()
 
-    def _register_preview_triggers(self) -> None:
-        schedule = lambda *_: self._schedule_preview_update()
+    def _on_timestamp_slider_moved(self, value: int) -> None:
+        self.timestamp_value_label.setText(_format_timestamp_ms(value))
+        # Scrub feedback: keep the spin value in sync quietly and let the
+        # drag-class debounce trickle out rough half-resolution renders.
+        with QSignalBlocker(self.timestamp_spin):
+            self.timestamp_spin.setValue(value / 1000.0)
+        if self.mode_combo.currentIndex() == 0:
+            self._schedule_preview_update(PREVIEW_DEBOUNCE_MS["drag"])
+
+    def _on_opacity_moved(self, value: int) -> None:
+        self.opacity_value_label.setText(f"{value}%")
 
-        self.mode_combo.currentIndexChanged.connect(schedule)
-        self.rows_spin.valueChanged.connect(schedule)
-        self.cols_spin.valueChanged.connect(schedule)
+    def _on_scale_moved(self, value: int) -> None:
+        self.image_scale_label.setText(f"{value}% width")
+
+    def _on_slider_pressed(self) -> None:
+        self._dragging = True
+
+    def _on_slider_released(self) -> None:
+        self._dragging = False
+        # Commit a full-quality render promptly once the drag ends.
+        self._schedule_preview_update(80)
+
+    def _register_preview_triggers(self) -> None:
+        # Controls with a dedicated handler (mode, watermark type, opacity,
+        # scale) schedule the preview from that handler instead of carrying a
+        # second connection per signal.
+        # The lazily-built text/image rows connect their own triggers when
+        # first constructed.
+        self.rows_spin.valueChanged.connect(self._schedule_numeric)
+        self.cols_spin.valueChanged.connect(self._schedule_numeric)
         self.randomize_frames_checkbox.toggled.connect(self._on_randomize_toggled)
-        self.watermark_type_combo.currentIndexChanged.connect(schedule)
-        self.opacity_slider.valueChanged.connect(schedule)
-        self.position_combo.currentIndexChanged.connect(schedule)
-        self.watermark_text_line.textChanged.connect(schedule)
-        self.font_size_spin.valueChanged.connect(schedule)
-        self.image_scale_slider.valueChanged.connect(schedule)
-
-    def _schedule_preview_update(self, delay: int = 400) -> None:
+        self.position_combo.currentIndexChanged.connect(self._schedule_quick)
+
+    def _video_exists(self) -> bool:
+        """Cached stat of the selected video; sliders re-trigger this per tick."""
+        now = time.monotonic()
+        checked_at, exists = self._video_stat_cache
+        if now - checked_at < 1.0:
+            return exists
+        exists = self.video_path is not None and self.video_path.exists()
+        self._video_stat_cache = (now, exists)
+        return exists
+
+    @contextmanager
+    def _batched_updates(self):
+        """Suppress repaints/relayouts while toggling many widgets at once.
+
+        Reentrant: nested batches (settings apply calling the mode/watermark
+        updaters) only toggle updates at the outermost level, so the whole
+        stack repaints once.
+        """
+        container = self.controls_container
+        if container is None:
+            yield
+            return
+        if self._update_batch_depth == 0:
+            container.setUpdatesEnabled(False)
+        self._update_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._update_batch_depth -= 1
+            if self._update_batch_depth == 0:
+                container.setUpdatesEnabled(True)
+
+    @contextmanager
+    def _suspend_previews(self):
+        """Collapse the preview scheduling from a burst of programmatic
+        widget updates into a single trailing render."""
+        self._previews_suspended = True
+        try:
+            yield
+        finally:
+            self._previews_suspended = False
+            self._schedule_preview_update(150)
+
+    def _schedule_preview_update(self, delay: Optional[int] = None) -> None:
+        if self._previews_suspended:
+            return
         self.preview_timer.stop()
-        if not self.video_path or not self.video_path.exists():
+        if not self._video_exists():
             return
+        if delay is None:
+            # Adaptive debounce: coalesce hard during slider drags, respond
+            # quickly when no preview is on screen yet.
+            if self._dragging:
+                delay = 400
+            elif self.current_pixmap is None:
+                delay = 80
+            else:
+                delay = 200
         self.preview_timer.start(delay)
 
+    def _schedule_quick(self) -> None:
+        """Discrete controls: leading-edge render when idle, short trailing
+        debounce otherwise."""
+        if self._previews_suspended:
+            return
+        if self._dragging:
+            self._schedule_preview_update(PREVIEW_DEBOUNCE_MS["drag"])
+            return
+        if (
+            not self.preview_timer.isActive()
+            and time.monotonic() - self._last_preview_dispatch >= 0.2
+        ):
+            self._start_preview_worker()
+        self._schedule_preview_update(PREVIEW_DEBOUNCE_MS["discrete"])
+
+    def _schedule_numeric(self) -> None:
+        """Spinboxes emit per arrow press; give them a mid-length window."""
+        self._schedule_preview_update(
+            PREVIEW_DEBOUNCE_MS["drag"] if self._dragging else PREVIEW_DEBOUNCE_MS["numeric"]
+        )
+
+    def _on_watermark_text_changed(self) -> None:
+        # Typing is bursty; debounce harder than other controls so
+        # intermediate characters never reach the render pipeline.
+        self._schedule_preview_update(PREVIEW_DEBOUNCE_MS["text"])
+
+    def _on_watermark_text_committed(self) -> None:
+        self._schedule_preview_update(80)
+
     @staticmethod
     def _set_form_row_visible(widget: QWidget, label: Optional[QLabel], visible: bool) -> None:
         widget.setVisible(visible)
@@ -877,80 +1254,127 @@ class MainWindow(QMainWindow):
             self._schedule_preview_update(150)
 
     def _select_resize_preset(self, size: Tuple[int, int]) -> None:
-        self.resize_combo.blockSignals(True)
-        matched = False
-        for idx in range(self.resize_combo.count()):
-            data = self.resize_combo.itemData(idx)
-            if isinstance(data, tuple) and tuple(data) == tuple(size):
+        idx = self._resize_preset_index.get(tuple(size), 0)
+        if self.resize_combo.count() > 0:
+            with QSignalBlocker(self.resize_combo):
                 self.resize_combo.setCurrentIndex(idx)
-                matched = True
-                break
-        if not matched and self.resize_combo.count() > 0:
-            self.resize_combo.setCurrentIndex(0)
-        self.resize_combo.blockSignals(False)
 
     def _on_timestamp_slider_changed(self, value: int) -> None:
-        if self._syncing_timestamp:
-            return
-        seconds = value / 1000.0
-        self._syncing_timestamp = True
-        self.timestamp_spin.blockSignals(True)
-        self.timestamp_spin.setValue(seconds)
-        self.timestamp_spin.blockSignals(False)
-        self.timestamp_value_label.setText(self._format_timestamp(seconds))
-        self._syncing_timestamp = False
+        with QSignalBlocker(self.timestamp_spin):
+            self.timestamp_spin.setValue(value / 1000.0)
+        self.timestamp_value_label.setText(_format_timestamp_ms(value))
         if self.mode_combo.currentIndex() == 0:
             self._schedule_preview_update(150)
 
     def _on_timestamp_spin_changed(self, value: float) -> None:
-        if self._syncing_timestamp:
-            return
         slider_value = int(value * 1000)
         slider_value = max(0, min(slider_value, self.timestamp_slider.maximum()))
-        self._syncing_timestamp = True
-        self.timestamp_slider.blockSignals(True)
-        self.timestamp_slider.setValue(slider_value)
-        self.timestamp_slider.blockSignals(False)
+        with QSignalBlocker(self.timestamp_slider):
+            self.timestamp_slider.setValue(slider_value)
         self.timestamp_value_label.setText(self._format_timestamp(value))
-        self._syncing_timestamp = False
         if self.mode_combo.currentIndex() == 0:
             self._schedule_preview_update(150)
 
     @staticmethod
     def _format_timestamp(value: float) -> str:
-        if value < 0:
-            value = 0.0
-        minutes = int(value // 60)
-        seconds = value % 60
-        return f"{minutes:02d}:{seconds:05.2f}"
+        return _format_timestamp_ms(int(round(value * 1000)))
+
+    def _preview_max_dim(self) -> Tuple[int, int]:
+        """Pixel budget for preview renders: label size times device ratio."""
+        dpr = self.devicePixelRatioF() or 1.0
+        size = self.preview_label.size()
+        return (
+            max(1, int(size.width() * dpr)),
+            max(1, int(size.height() * dpr)),
+        )
 
-    def _start_preview_worker(self) -> None:
-        if not self.video_path or not self.video_path.exists():
+    def _preview_cache_key(
+        self,
+        thumbnail_settings: ThumbnailSettings,
+        watermark_settings: WatermarkSettings,
+        max_dim: Optional[Tuple[int, int]] = None,
+    ) -> Optional[tuple]:
+        """Hashable key of the inputs that determine a rendered preview.
+
+        The settings dataclasses are frozen, so they key the dict directly —
+        no serialization or digest step.
+        """
+        if self.video_path is None:
+            return None
+        try:
+            mtime_ns = self.video_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        return (
+            str(self.video_path),
+            mtime_ns,
+            max_dim,
+            thumbnail_settings,
+            watermark_settings,
+        )
+
+    def _store_preview_pixmap(self, key: Optional[tuple], pixmap: QPixmap) -> None:
+        if key is None:
             return
+        self._preview_cache[key] = pixmap
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
 
-        if self.preview_worker_thread and self.preview_worker_thread.isRunning():
-            self.preview_needs_refresh = True
+    def _start_preview_worker(self) -> None:
+        if not self._video_exists():
             return
+        self._last_preview_dispatch = time.monotonic()
 
         thumbnail_settings = self._gather_thumbnail_settings()
         watermark_settings = self._gather_watermark_settings()
 
+        # Any in-flight render is now stale and will self-discard.
+        self._preview_generation += 1
+
+        max_dim = self._preview_max_dim()
+        if self._dragging:
+            # Rough pass while scrubbing: a 2x smaller render is ~4x less
+            # pixel work; the release handler schedules the full-res pass.
+            max_dim = (max(1, max_dim[0] // 2), max(1, max_dim[1] // 2))
+        cache_key = self._preview_cache_key(thumbnail_settings, watermark_settings, max_dim)
+        if (
+            cache_key is not None
+            and cache_key == self._last_rendered_key
+            and self.current_pixmap is not None
+        ):
+            # Settings are bit-for-bit what is already on screen: nothing to do.
+            return
+        if cache_key is not None and cache_key in self._preview_cache:
+            # Repeat state: skip the thread pool and reuse the rendered pixmap.
+            self._preview_cache.move_to_end(cache_key)
+            self._last_rendered_key = cache_key
+            self._show_preview_pixmap(self._preview_cache[cache_key])
+            return
+
+        if self._generator is None:
+            return
+
         self.preview_label.setPixmap(QPixmap())
         self.preview_label.setText("Rendering preview…")
 
-        self.preview_worker_thread = QThread(self)
-        self.preview_worker = PreviewWorker(
-            self.video_path, thumbnail_settings, watermark_settings
-        )
-        self.preview_worker.moveToThread(self.preview_worker_thread)
-        self.preview_worker_thread.started.connect(self.preview_worker.run)
-        self.preview_worker.finished.connect(self._on_preview_ready)
-        self.preview_worker.error.connect(self._on_preview_error)
-        self.preview_worker.finished.connect(self._cleanup_preview_worker)
-        self.preview_worker.error.connect(self._cleanup_preview_worker)
-        self.preview_worker_thread.start()
-
-    def _on_preview_ready(self, pixmap: QPixmap) -> None:
+        if self._preview_runnable.set_inputs(
+            self._generator,
+            thumbnail_settings,
+            watermark_settings,
+            self._preview_generation,
+            max_dim,
+            cache_key,
+        ):
+            self._thread_pool.start(self._preview_runnable)
+
+    def _on_preview_ready(self, cache_key: Optional[tuple], qimage: QImage) -> None:
+        pixmap = qimage_to_pixmap(qimage)
+        self._store_preview_pixmap(cache_key, pixmap)
+        self._last_rendered_key = cache_key
+        self._show_preview_pixmap(pixmap)
+
+    def _show_preview_pixmap(self, pixmap: QPixmap) -> None:
         self.current_pixmap = pixmap
         self.preview_label.setText("")
         self._refresh_preview()
@@ -959,21 +1383,6 @@ class MainWindow(QMainWindow):
         self.preview_label.setPixmap(QPixmap())
         self.preview_label.setText(f"Preview failed: {message}")
 
-    def _cleanup_preview_worker(self) -> None:
-        if self.preview_worker_thread:
-            if self.preview_worker_thread.isRunning():
-                self.preview_worker_thread.quit()
-                self.preview_worker_thread.wait()
-            self.preview_worker_thread.deleteLater()
-        if self.preview_worker:
-            self.preview_worker.deleteLater()
-        self.preview_worker_thread = None
-        self.preview_worker = None
-
-        if self.preview_needs_refresh:
-            self.preview_needs_refresh = False
-            # Restart preview with a slight delay to batch rapid changes.
-            self._schedule_preview_update(150)
     def _select_video(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Video", "", "Video Files (*.mp4 *.mov *.avi *.mkv)"
@@ -982,111 +1391,211 @@ class MainWindow(QMainWindow):
             return
         self.video_path = Path(file_path)
         self.random_seed = None
+        self._video_stat_cache = (0.0, False)
         self.video_path_line.setText(file_path)
 
+        if self._generator is not None:
+            # Release the previous video's cached decoder before swapping.
+            with self._generator_lock:
+                self._generator.close()
+            self._generator = None
         try:
-            generator = ThumbnailGenerator(self.video_path)
-            info = generator.get_video_info()
-            duration_str = f"{info.duration:.2f} s" if info.duration else "Unknown"
-            self.video_info_label.setText(
-                f"Duration: {duration_str} | Resolution: {info.resolution} | FPS: {info.fps:.2f}"
-            )
-            self.video_duration = info.duration
-            self.timestamp_spin.setRange(0.0, max(info.duration, 0.0))
-            if info.duration > 0:
-                mid_value = round(info.duration / 2.0, 2)
-                self.timestamp_spin.setValue(mid_value)
-            slider_max = max(0, int(info.duration * 1000))
-            self.timestamp_slider.setRange(0, slider_max)
-            self.timestamp_slider.setEnabled(self.mode_combo.currentIndex() == 0 and slider_max > 0)
-            self.timestamp_slider.setValue(int(self.timestamp_spin.value() * 1000))
-            self.timestamp_value_label.setText(self._format_timestamp(self.timestamp_spin.value()))
+            self._generator = ThumbnailGenerator(self.video_path)
         except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Failed to read video: {exc}")
-            self.video_info_label.setText("Failed to read video metadata.")
-            self.video_path = None
-            self.video_path_line.clear()
-            self.random_seed = None
-            self.video_duration = 0.0
-            self.timestamp_slider.setRange(0, 0)
-            self.timestamp_slider.setEnabled(False)
-            self.timestamp_value_label.setText(self._format_timestamp(0.0))
-            self.preview_label.setPixmap(QPixmap())
-            self.preview_label.setText("Select a video to preview.")
+            self._on_video_info_error(self.video_path, str(exc))
             return
 
+        cached = self._load_cached_video_info(self.video_path)
+        if cached is not None:
+            self._apply_video_info(cached)
+            return
+
+        # Probe in the background so the UI never blocks on ffprobe.
+        self.video_info_label.setText("Reading video metadata…")
+        worker = VideoInfoWorker(self._generator)
+        worker.signals.finished.connect(self._on_video_info_ready)
+        worker.signals.error.connect(self._on_video_info_error)
+        self._video_info_worker = worker
+        self._thread_pool.start(worker)
+
+    def _on_video_info_ready(self, info: VideoInfo) -> None:
+        self._video_info_worker = None
+        if self.video_path != info.path:
+            return  # a different video was selected meanwhile
+        self._store_cached_video_info(info)
+        self._apply_video_info(info)
+
+    def _apply_video_info(self, info: VideoInfo) -> None:
+        duration_str = f"{info.duration:.2f} s" if info.duration else "Unknown"
+        self.video_info_label.setText(
+            f"Duration: {duration_str} | Resolution: {info.resolution} | FPS: {info.fps:.2f}"
+        )
+        self.video_duration = info.duration
+        self.timestamp_spin.setRange(0.0, max(info.duration, 0.0))
+        if info.duration > 0:
+            mid_value = round(info.duration / 2.0, 2)
+            self.timestamp_spin.setValue(mid_value)
+        slider_max = max(0, int(info.duration * 1000))
+        self.timestamp_slider.setRange(0, slider_max)
+        self.timestamp_slider.setEnabled(self.mode_combo.currentIndex() == 0 and slider_max > 0)
+        self.timestamp_slider.setValue(int(self.timestamp_spin.value() * 1000))
+        self.timestamp_value_label.setText(self._format_timestamp(self.timestamp_spin.value()))
+
         # Suggest an output path next to the video
         default_output = self.video_path.with_name(f"{self.video_path.stem}_thumbnail")
         self.output_path_line.setText(str(default_output.with_suffix(".jpg")))
         self._schedule_preview_update(200)
 
+    def _on_video_info_error(self, path: Path, message: str) -> None:
+        if self.video_path != path:
+            return  # stale probe for a video the user already moved away from
+        self._video_info_worker = None
+        QMessageBox.critical(self, "Error", f"Failed to read video: {message}")
+        self.video_info_label.setText("Failed to read video metadata.")
+        self.video_path = None
+        # Invalidate the stat cache too, or _video_exists() keeps answering
+        # True for up to a second after the selection is cleared.
+        self._video_stat_cache = (0.0, False)
+        self._generator = None
+        self.video_path_line.clear()
+        self.random_seed = None
+        self.video_duration = 0.0
+        self.timestamp_slider.setRange(0, 0)
+        self.timestamp_slider.setEnabled(False)
+        self.timestamp_value_label.setText(self._format_timestamp(0.0))
+        self.preview_label.setPixmap(QPixmap())
+        self.preview_label.setText("Select a video to preview.")
+
+    @staticmethod
+    def _videoinfo_cache_key(path: Path, stat: "os.stat_result") -> str:
+        return f"{path}|{stat.st_size}|{int(stat.st_mtime)}"
+
+    def _load_cached_video_info(self, path: Path) -> Optional[VideoInfo]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if self._videoinfo_cache is None:
+            try:
+                self._videoinfo_cache = json.loads(
+                    VIDEOINFO_CACHE_PATH.read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                self._videoinfo_cache = {}
+        entry = self._videoinfo_cache.get(self._videoinfo_cache_key(path, stat))
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return VideoInfo(
+                path=path,
+                duration=float(entry["duration"]),
+                width=int(entry["width"]),
+                height=int(entry["height"]),
+                fps=float(entry["fps"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _store_cached_video_info(self, info: VideoInfo) -> None:
+        try:
+            stat = info.path.stat()
+        except OSError:
+            return
+        if self._videoinfo_cache is None:
+            self._videoinfo_cache = {}
+        self._videoinfo_cache[self._videoinfo_cache_key(info.path, stat)] = {
+            "duration": info.duration,
+            "width": info.width,
+            "height": info.height,
+            "fps": info.fps,
+        }
+        while len(self._videoinfo_cache) > VIDEOINFO_CACHE_SIZE:
+            self._videoinfo_cache.pop(next(iter(self._videoinfo_cache)))
+        try:
+            VIDEOINFO_CACHE_PATH.write_text(
+                json.dumps(self._videoinfo_cache), encoding="utf-8"
+            )
+        except OSError:
+            pass  # best-effort cache; probing again later is fine
+
     def _update_mode_controls(self) -> None:
-        mode = self.mode_combo.currentIndex()
-        is_single = mode == 0
-        self.timestamp_spin.setEnabled(is_single)
-        self.timestamp_slider.setEnabled(is_single and self.video_duration > 0)
-        self._set_form_row_visible(self.timestamp_slider_container, self.timestamp_slider_label, is_single)
-        self._set_form_row_visible(self.timestamp_spin, self.timestamp_spin_label, is_single)
-
-        self.rows_spin.setEnabled(not is_single)
-        self.cols_spin.setEnabled(not is_single)
-        self.randomize_frames_checkbox.setEnabled(not is_single)
-        self._set_form_row_visible(self.grid_container, self.grid_container_label, not is_single)
-        self._set_form_row_visible(
-            self.randomize_frames_checkbox, self.randomize_checkbox_label, not is_single
-        )
-        if is_single:
-            self.random_seed = None
-        self._schedule_preview_update()
-        self._sync_sidebar_width()
+        with self._batched_updates():
+            mode = self.mode_combo.currentIndex()
+            is_single = mode == 0
+            self.timestamp_spin.setEnabled(is_single)
+            self.timestamp_slider.setEnabled(is_single and self.video_duration > 0)
+            self._set_form_row_visible(self.timestamp_slider_container, self.timestamp_slider_label, is_single)
+            self._set_form_row_visible(self.timestamp_spin, self.timestamp_spin_label, is_single)
+
+            self.rows_spin.setEnabled(not is_single)
+            self.cols_spin.setEnabled(not is_single)
+            self.randomize_frames_checkbox.setEnabled(not is_single)
+            self._set_form_row_visible(self.grid_container, self.grid_container_label, not is_single)
+            self._set_form_row_visible(
+                self.randomize_frames_checkbox, self.randomize_checkbox_label, not is_single
+            )
+            if is_single:
+                self.random_seed = None
+            self._schedule_preview_update()
+            self._sync_sidebar_width()
 
     def _update_watermark_controls(self) -> None:
-        selection = self.watermark_type_combo.currentText().lower()
-        is_text = selection == "text"
-        is_image = selection == "image"
-        show_common = selection != "none"
-
-        self.opacity_slider.setEnabled(show_common)
-        self.position_combo.setEnabled(show_common)
-
-        for widget in [
-            self.watermark_text_line,
-            self.font_path_display,
-            self.font_browse_btn,
-            self.font_size_spin,
-            self.color_button,
-            self.color_preview,
-        ]:
-            widget.setEnabled(is_text)
-
-        for widget in [
-            self.watermark_image_line,
-            self.watermark_image_browse,
-            self.image_scale_slider,
-        ]:
-            widget.setEnabled(is_image)
-
-        self._set_form_row_visible(self.opacity_container, self.opacity_label, show_common)
-        self._set_form_row_visible(self.position_combo, self.position_label, show_common)
-
-        self._set_form_row_visible(
-            self.watermark_text_line, self.watermark_text_label, is_text
-        )
-        self._set_form_row_visible(self.font_container, self.font_container_label, is_text)
-        self._set_form_row_visible(self.font_size_spin, self.font_size_label, is_text)
-        self._set_form_row_visible(self.color_container, self.color_label, is_text)
+        with self._batched_updates():
+            selection = self._watermark_kind
+            is_text = selection == "text"
+            is_image = selection == "image"
+            show_common = selection != "none"
+
+            if is_text:
+                self._ensure_text_watermark_rows()
+            if is_image:
+                self._ensure_image_watermark_rows()
+
+            self.opacity_slider.setEnabled(show_common)
+            self.position_combo.setEnabled(show_common)
+
+            if self.watermark_text_line is not None:
+                for widget in [
+                    self.watermark_text_line,
+                    self.font_path_display,
+                    self.font_browse_btn,
+                    self.font_size_spin,
+                    self.color_button,
+                    self.color_preview,
+                ]:
+                    widget.setEnabled(is_text)
+                self._set_form_row_visible(
+                    self.watermark_text_line, self.watermark_text_label, is_text
+                )
+                self._set_form_row_visible(self.font_container, self.font_container_label, is_text)
+                self._set_form_row_visible(self.font_size_spin, self.font_size_label, is_text)
+                self._set_form_row_visible(self.color_container, self.color_label, is_text)
+
+            if self.watermark_image_line is not None:
+                for widget in [
+                    self.watermark_image_line,
+                    self.watermark_image_browse,
+                    self.image_scale_slider,
+                ]:
+                    widget.setEnabled(is_image)
+                self._set_form_row_visible(
+                    self.image_container, self.image_container_label, is_image
+                )
+                self._set_form_row_visible(self.scale_container, self.scale_container_label, is_image)
+
+            self._set_form_row_visible(self.opacity_container, self.opacity_label, show_common)
+            self._set_form_row_visible(self.position_combo, self.position_label, show_common)
 
-        self._set_form_row_visible(self.image_container, self.image_container_label, is_image)
-        self._set_form_row_visible(self.scale_container, self.scale_container_label, is_image)
-
-        self._schedule_preview_update()
-        self._sync_sidebar_width()
+            self._schedule_preview_update()
+            self._sync_sidebar_width()
 
     def _on_opacity_changed(self, value: int) -> None:
         self.opacity_value_label.setText(f"{value}%")
+        self._schedule_quick()
 
     def _on_scale_changed(self, value: int) -> None:
         self.image_scale_label.setText(f"{value}% width")
+        self._schedule_quick()
 
     def _choose_color(self) -> None:
         color = QColorDialog.getColor(QColor(self.selected_color), self, "Select Watermark Color")
@@ -1117,7 +1626,7 @@ class MainWindow(QMainWindow):
         self._schedule_preview_update()
 
     def _select_output_file(self) -> None:
-        selected_format = self.output_format_combo.currentText().lower()
+        selected_format = self._output_format
         filters = "JPEG Image (*.jpg *.jpeg);;PNG Image (*.png)" if selected_format == "jpg" else "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg)"
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -1136,21 +1645,14 @@ class MainWindow(QMainWindow):
         cols = int(self.cols_spin.value())
         randomize = bool(self.randomize_frames_checkbox.isChecked())
 
-        output_path = self.output_path_line.text().strip()
-        if not output_path:
-            # fallback next to video or current working directory
-            base = (
-                self.video_path.with_name(f"{self.video_path.stem}_thumbnail")
-                if self.video_path
-                else Path("thumbnail")
-            )
-            output_path = str(base.with_suffix(f".{self.output_format_combo.currentText()}"))
-
-        output_format = self.output_format_combo.currentText().lower()
+        output_path = self._derive_output_path()
+        output_format = self._output_format
 
         if randomize:
             if self.random_seed is None:
-                self.random_seed = random.randint(0, 2_147_483_647)
+                # secrets.randbits avoids the lock around the shared global
+                # random state; drawn once per randomize toggle.
+                self.random_seed = secrets.randbits(31)
         else:
             self.random_seed = None
 
@@ -1167,22 +1669,49 @@ class MainWindow(QMainWindow):
             columns=cols,
             randomize=randomize,
             random_seed=self.random_seed,
-            output_path=Path(output_path),
+            output_path=output_path,
             output_format=output_format,
             resize_to=resize_to,
         )
 
+    def _derive_output_path(self) -> Path:
+        """Resolve the output Path, memoized — gathers run many times per
+        second while the inputs rarely change."""
+        text = self.output_path_line.text().strip()
+        key = (
+            str(self.video_path) if self.video_path else None,
+            text,
+            self._output_format,
+        )
+        if key == self._output_path_key:
+            return self._output_path_cache
+        if text:
+            path = Path(text)
+        else:
+            # fallback next to video or current working directory
+            base = (
+                self.video_path.with_name(f"{self.video_path.stem}_thumbnail")
+                if self.video_path
+                else Path("thumbnail")
+            )
+            path = base.with_suffix(f".{self._output_format}")
+        self._output_path_key = key
+        self._output_path_cache = path
+        return path
+
     def _gather_watermark_settings(self) -> WatermarkSettings:
-        kind = self.watermark_type_combo.currentText().lower()
+        kind = self._watermark_kind
         opacity = int(self.opacity_slider.value())
-        position = self.position_combo.currentText()
-        text = self.watermark_text_line.text().strip()
+        position = self._position
+        text = self.watermark_text_line.text().strip() if self.watermark_text_line else ""
         font_path = self.selected_font_path
-        font_size = int(self.font_size_spin.value())
+        font_size = int(self.font_size_spin.value()) if self.font_size_spin else 48
         color = self.selected_color
-        image_path_str = self.watermark_image_line.text().strip()
+        image_path_str = (
+            self.watermark_image_line.text().strip() if self.watermark_image_line else ""
+        )
         image_path = Path(image_path_str) if image_path_str else None
-        scale = self.image_scale_slider.value() / 100.0
+        scale = self.image_scale_slider.value() / 100.0 if self.image_scale_slider else 0.3
 
         return WatermarkSettings(
             kind=kind,
@@ -1207,36 +1736,23 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.generate_btn.setEnabled(False)
 
-        self.worker_thread = QThread(self)
         self.worker = ThumbnailWorker(self.video_path, thumbnail_settings, watermark_settings)
-        self.worker.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.progress_changed.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self._on_generation_finished)
-        self.worker.error.connect(self._on_generation_error)
-        self.worker.finished.connect(self._cleanup_worker)
-        self.worker.error.connect(self._cleanup_worker)
-        self.worker_thread.start()
-
-    def _on_generation_finished(self, output_path: str, pixmap: QPixmap) -> None:
-        self.current_pixmap = pixmap
+        self.worker.signals.progress_changed.connect(self.progress_bar.setValue)
+        self.worker.signals.finished.connect(self._on_generation_finished)
+        self.worker.signals.error.connect(self._on_generation_error)
+        self._thread_pool.start(self.worker)
+
+    def _on_generation_finished(self, output_path: str, qimage: QImage) -> None:
+        self.generate_btn.setEnabled(True)
+        self.worker = None
+        self.current_pixmap = qimage_to_pixmap(qimage)
         self._refresh_preview()
         QMessageBox.information(self, "Success", f"Thumbnail saved to:\n{output_path}")
 
     def _on_generation_error(self, message: str) -> None:
-        QMessageBox.critical(self, "Generation Failed", message)
-
-    def _cleanup_worker(self) -> None:
         self.generate_btn.setEnabled(True)
-        if self.worker_thread:
-            if self.worker_thread.isRunning():
-                self.worker_thread.quit()
-                self.worker_thread.wait()
-            self.worker_thread.deleteLater()
-        if self.worker:
-            self.worker.deleteLater()
-        self.worker_thread = None
         self.worker = None
+        QMessageBox.critical(self, "Generation Failed", message)
 
     def _save_settings(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -1275,9 +1791,18 @@ class MainWindow(QMainWindow):
         self._apply_persisted_settings(persisted)
 
     def _apply_persisted_settings(self, persisted: PersistedSettings) -> None:
+        with self._suspend_previews(), self._batched_updates():
+            self._apply_persisted_settings_inner(persisted)
+
+    def _apply_persisted_settings_inner(self, persisted: PersistedSettings) -> None:
         thumb = persisted.thumbnail
         water = persisted.watermark
 
+        # Loaded settings write into the lazily-built rows; make sure both
+        # exist before restoring their values.
+        self._ensure_text_watermark_rows()
+        self._ensure_image_watermark_rows()
+
         self.mode_combo.setCurrentIndex(0 if thumb.mode == "single" else 1)
         self.timestamp_spin.setValue(thumb.timestamp)
         self.rows_spin.setValue(thumb.rows)
@@ -1289,16 +1814,14 @@ class MainWindow(QMainWindow):
             self.output_format_combo.setCurrentIndex(format_index)
         self.random_seed = thumb.random_seed if thumb.randomize else None
 
-        self.resize_checkbox.blockSignals(True)
-        self.resize_checkbox.setChecked(thumb.resize_to is not None)
-        self.resize_checkbox.blockSignals(False)
+        with QSignalBlocker(self.resize_checkbox):
+            self.resize_checkbox.setChecked(thumb.resize_to is not None)
         if thumb.resize_to:
             self._select_resize_preset(tuple(thumb.resize_to))
         else:
-            self.resize_combo.blockSignals(True)
             if self.resize_combo.count() > 0:
-                self.resize_combo.setCurrentIndex(0)
-            self.resize_combo.blockSignals(False)
+                with QSignalBlocker(self.resize_combo):
+                    self.resize_combo.setCurrentIndex(0)
         self._on_resize_toggled(self.resize_checkbox.isChecked())
 
         self.watermark_type_combo.setCurrentIndex(
@@ -1326,22 +1849,70 @@ class MainWindow(QMainWindow):
 
         self._update_mode_controls()
         self._update_watermark_controls()
-        self._schedule_preview_update(150)
 
     def _refresh_preview(self) -> None:
+        if self._dragging:
+            self._refresh_preview_fast()
+        else:
+            self._refresh_preview_smooth()
+
+    def _display_target_size(self) -> Tuple[float, int, int]:
+        """Device pixel ratio plus the label size in device pixels."""
+        dpr = self.devicePixelRatioF() or 1.0
+        size = self.preview_label.size()
+        return dpr, max(1, int(size.width() * dpr)), max(1, int(size.height() * dpr))
+
+    def _refresh_preview_fast(self) -> None:
+        """Nearest-neighbour rescale for interactive updates; cheap but rough."""
         if self.current_pixmap:
+            self._label_shows_smooth = False
+            dpr, target_w, target_h = self._display_target_size()
             scaled = self.current_pixmap.scaled(
-                self.preview_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+                target_w, target_h, Qt.KeepAspectRatio, Qt.FastTransformation
             )
+            scaled.setDevicePixelRatio(dpr)
             self.preview_label.setPixmap(scaled)
+            self._smooth_upgrade_timer.start()
+
+    def _refresh_preview_smooth(self) -> None:
+        if self.current_pixmap:
+            self._smooth_upgrade_timer.stop()
+            dpr, target_w, target_h = self._display_target_size()
+            if self._last_smooth_key is not None and self._display_pixmap is not None:
+                last_source, last_w, last_h = self._last_smooth_key
+                if (
+                    last_source == self.current_pixmap.cacheKey()
+                    and abs(last_w - target_w) <= target_w * 0.05
+                    and abs(last_h - target_h) <= target_h * 0.05
+                ):
+                    # Within threshold: reuse the cached smooth scale, only
+                    # restoring it if a fast pass replaced it on the label.
+                    if not self._label_shows_smooth:
+                        self.preview_label.setPixmap(self._display_pixmap)
+                        self._label_shows_smooth = True
+                    return
+            scaled = self.current_pixmap.scaled(
+                target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            scaled.setDevicePixelRatio(dpr)
+            self._display_pixmap = scaled
+            self.preview_label.setPixmap(scaled)
+            self._label_shows_smooth = True
+            self._last_smooth_key = (self.current_pixmap.cacheKey(), target_w, target_h)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._refresh_preview()
+        # Cheap nearest-neighbour feedback now; the timer settles with a
+        # smooth pass once the drag pauses.
+        self._refresh_preview_fast()
+        self._resize_timer.start()
 
 
 def main() -> None:
+    backend = "Pillow-SIMD" if PILLOW_SIMD_ACTIVE else "Pillow"
+    print(f"Image backend: {backend} {getattr(Image, '__version__', 'unknown')}")
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLE)
     icon_path = resource_path(APP_ICON_PATH)
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
@@ -4,40 +4,63 @@ Simple JSON settings persistence.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-from thumbnail_generator import ThumbnailSettings
-from watermark_manager import WatermarkSettings
+try:  # orjson serializes/parses several times faster; fall back to stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from thumbnail_generator import ThumbnailSettings
+    from watermark_manager import WatermarkSettings
 
 DEFAULT_SETTINGS_PATH = Path("thumbnail_settings.json")
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistedSettings:
     thumbnail: ThumbnailSettings
     watermark: WatermarkSettings
 
     def to_dict(self) -> Dict[str, Any]:
-        thumb_dict = asdict(self.thumbnail)
-        thumb_dict["output_path"] = str(thumb_dict.get("output_path", ""))
-        if thumb_dict.get("resize_to"):
-            thumb_dict["resize_to"] = list(thumb_dict["resize_to"])
-
-        water_dict = asdict(self.watermark)
-        if water_dict.get("font_path"):
-            water_dict["font_path"] = str(water_dict["font_path"])
-        if water_dict.get("image_path"):
-            water_dict["image_path"] = str(water_dict["image_path"])
-
+        # Built by direct field access: asdict recursively deep-copies every
+        # field (then the Paths still needed re-stringifying on top).
+        thumb = self.thumbnail
+        water = self.watermark
         return {
-            "thumbnail": thumb_dict,
-            "watermark": water_dict,
+            "thumbnail": {
+                "mode": thumb.mode,
+                "timestamp": thumb.timestamp,
+                "rows": thumb.rows,
+                "columns": thumb.columns,
+                "randomize": thumb.randomize,
+                "random_seed": thumb.random_seed,
+                "output_path": str(thumb.output_path),
+                "output_format": thumb.output_format,
+                "resize_to": list(thumb.resize_to) if thumb.resize_to else None,
+            },
+            "watermark": {
+                "kind": water.kind,
+                "opacity": water.opacity,
+                "position": water.position,
+                "text": water.text,
+                "font_path": str(water.font_path) if water.font_path else None,
+                "font_size": water.font_size,
+                "color": water.color,
+                "image_path": str(water.image_path) if water.image_path else None,
+                "scale": water.scale,
+            },
         }
 
     @staticmethod
     def from_dict(payload: Dict[str, Any]) -> "PersistedSettings":
+        from thumbnail_generator import ThumbnailSettings
+        from watermark_manager import WatermarkSettings
+
         thumb_data = payload.get("thumbnail", {})
         water_data = payload.get("watermark", {})
         return PersistedSettings(
@@ -87,14 +110,33 @@ class SettingsManager:
         payload = PersistedSettings(thumbnail=thumbnail, watermark=watermark).to_dict()
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as stream:
-            json.dump(payload, stream, indent=2)
+        if orjson is not None:
+            new_bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            new_bytes = json.dumps(payload, indent=2).encode("utf-8")
+
+        # Saving unchanged settings is a no-op; otherwise write via a temp
+        # file + fsync + atomic rename so a crash can't corrupt the file.
+        try:
+            if path.read_bytes() == new_bytes:
+                return
+        except OSError:
+            pass
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as stream:
+            stream.write(new_bytes)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(tmp_path, path)
 
     @staticmethod
     def load(path: Path) -> PersistedSettings:
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"Settings file not found: {path}")
-        with path.open("r", encoding="utf-8") as stream:
-            payload = json.load(stream)
+        if orjson is not None:
+            payload = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as stream:
+                payload = json.load(stream)
         return PersistedSettings.from_dict(payload)
@@ -3,19 +3,57 @@ High-level thumbnail generation logic for both single and grid modes.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 
 from video_processor import VideoInfo, VideoProcessor
 from watermark_manager import WatermarkManager, WatermarkSettings
 
 ProgressCallback = Optional[Callable[[int], None]]
+CancelCheck = Optional[Callable[[], bool]]
 
 
-@dataclass
+class PreviewCancelled(Exception):
+    """Raised mid-render when a preview has been superseded by newer settings."""
+
+
+class _ThrottledProgress:
+    """Filters a progress callback down to meaningful updates.
+
+    Per-frame callbacks from large grids can outnumber visible progress-bar
+    changes by orders of magnitude; only pass values through when the percent
+    actually changed and at most every 50 ms. Terminal (>=100) values always
+    go through.
+    """
+
+    __slots__ = ("_callback", "_min_interval", "_last_percent", "_last_time")
+
+    def __init__(self, callback: Callable[[int], None], min_interval: float = 0.05) -> None:
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_percent = -1
+        self._last_time = 0.0
+
+    def __call__(self, percent: int) -> None:
+        now = time.monotonic()
+        if percent >= 100 or (
+            percent != self._last_percent
+            and now - self._last_time >= self._min_interval
+        ):
+            self._last_percent = percent
+            self._last_time = now
+            self._callback(percent)
+
+
+@dataclass(frozen=True, slots=True)
 class ThumbnailSettings:
     mode: str  # "single" or "grid"
     timestamp: float = 0.0
@@ -31,58 +69,218 @@ class ThumbnailSettings:
 class ThumbnailGenerator:
     """Coordinates frame extraction, grid assembly, watermarking, and saving."""
 
+    # Preview-sized decoded bases (with their downscale factor) kept per
+    # generator; watermark-only tweaks then skip the video decode entirely.
+    BASE_CACHE_SIZE = 4
+
     def __init__(self, video_path: Path) -> None:
         self.video_path = Path(video_path)
         self.video_processor = VideoProcessor(self.video_path)
         self.watermark_manager = WatermarkManager()
+        self._base_cache: "OrderedDict[tuple, Tuple[Image.Image, float]]" = OrderedDict()
 
     def get_video_info(self) -> VideoInfo:
         return self.video_processor.get_video_info()
 
+    def close(self) -> None:
+        """Release any decoder state held for this video."""
+        self.video_processor.close()
+
     def generate(
         self,
         thumbnail_settings: ThumbnailSettings,
         watermark_settings: WatermarkSettings,
         progress_callback: ProgressCallback = None,
     ) -> Tuple[Path, Image.Image]:
-        watermarked = self.render_image(
-            thumbnail_settings,
-            watermark_settings,
-            progress_callback=progress_callback,
-        )
+        # One-shot generation owns its decoder: share the clip across every
+        # info/frame call in the render, then release it at the end.
+        with self.video_processor:
+            watermarked = self.render_image(
+                thumbnail_settings,
+                watermark_settings,
+                progress_callback=progress_callback,
+            )
 
         output_path = self._ensure_output_path(thumbnail_settings)
         pil_format = self._resolve_format(thumbnail_settings.output_format)
-        watermarked.save(str(output_path), format=pil_format)
+        watermarked.save(
+            str(output_path), format=pil_format, **self._save_kwargs(pil_format)
+        )
 
         if progress_callback:
             progress_callback(100)
 
         return output_path, watermarked
 
+    def generate_many(
+        self,
+        items: List[Tuple[ThumbnailSettings, WatermarkSettings]],
+        progress_callback: ProgressCallback = None,
+    ) -> List[Tuple[Path, Image.Image]]:
+        """
+        Generate several thumbnails from this video in one batch.
+
+        Setup cost is paid once: the decoder stays open for the whole run
+        (renders share the cached reader, fonts, and watermark caches) and
+        the encode/save step fans out across a thread pool since Pillow's
+        encoders release the GIL. Renders themselves stay serial — the
+        shared clip reader is not thread-safe. Progress covers renders
+        (0-80) then saves (80-100).
+        """
+        if not items:
+            return []
+        if progress_callback is not None:
+            progress_callback = _ThrottledProgress(progress_callback)
+
+        total = len(items)
+        staged: List[Tuple[Path, str, Image.Image]] = []
+        with self.video_processor:
+            for index, (thumbnail_settings, watermark_settings) in enumerate(items, 1):
+                image = self.render_image(thumbnail_settings, watermark_settings)
+                staged.append(
+                    (
+                        self._ensure_output_path(thumbnail_settings),
+                        self._resolve_format(thumbnail_settings.output_format),
+                        image,
+                    )
+                )
+                if progress_callback:
+                    progress_callback(int(index / total * 80))
+
+        def save_one(item: Tuple[Path, str, Image.Image]) -> Tuple[Path, Image.Image]:
+            output_path, pil_format, image = item
+            image.save(
+                str(output_path), format=pil_format, **self._save_kwargs(pil_format)
+            )
+            return output_path, image
+
+        results: List[Tuple[Path, Image.Image]] = []
+        workers = min(total, os.cpu_count() or 1, 4)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for index, result in enumerate(pool.map(save_one, staged), 1):
+                    results.append(result)
+                    if progress_callback:
+                        progress_callback(80 + int(index / total * 20))
+        else:
+            for index, item in enumerate(staged, 1):
+                results.append(save_one(item))
+                if progress_callback:
+                    progress_callback(80 + int(index / total * 20))
+
+        if progress_callback:
+            progress_callback(100)
+        return results
+
     def render_image(
         self,
         thumbnail_settings: ThumbnailSettings,
         watermark_settings: WatermarkSettings,
         progress_callback: ProgressCallback = None,
+        max_dim: Optional[Tuple[int, int]] = None,
+        should_cancel: CancelCheck = None,
     ) -> Image.Image:
-        if thumbnail_settings.mode == "single":
-            base_image = self._generate_single(thumbnail_settings, progress_callback)
-        elif thumbnail_settings.mode == "grid":
-            base_image = self._generate_grid(thumbnail_settings, progress_callback)
+        """
+        Render the composed thumbnail. When max_dim is given (preview path),
+        the base image is shrunk to fit within it before compositing so the
+        expensive watermark/resize work happens at display resolution.
+
+        should_cancel is polled between pipeline stages (and between frame
+        decodes, via the progress callback); when it returns True the render
+        aborts with PreviewCancelled.
+        """
+        if progress_callback is not None:
+            progress_callback = _ThrottledProgress(progress_callback)
+
+        if should_cancel is not None:
+            # Check between frame decodes by riding the progress callback.
+            downstream = progress_callback
+
+            def progress_callback(percent: int) -> None:
+                if should_cancel():
+                    raise PreviewCancelled()
+                if downstream:
+                    downstream(percent)
+
+        self._raise_if_cancelled(should_cancel)
+        base_cache_key = self._base_cache_key(thumbnail_settings, max_dim)
+        fit_factor = 1.0
+        cached = (
+            self._base_cache.get(base_cache_key) if base_cache_key is not None else None
+        )
+        if cached is not None:
+            base_image, fit_factor = cached
+            self._base_cache.move_to_end(base_cache_key)
         else:
-            raise ValueError(f"Unsupported mode: {thumbnail_settings.mode}")
+            if thumbnail_settings.mode == "single":
+                base_image = self._generate_single(thumbnail_settings, progress_callback)
+            elif thumbnail_settings.mode == "grid":
+                base_image = self._generate_grid(thumbnail_settings, progress_callback)
+            else:
+                raise ValueError(f"Unsupported mode: {thumbnail_settings.mode}")
+            if max_dim is not None:
+                full_width = base_image.width
+                base_image = self._fit_within(base_image, max_dim)
+                if full_width:
+                    fit_factor = base_image.width / full_width
+            if base_cache_key is not None:
+                self._base_cache[base_cache_key] = (base_image, fit_factor)
+                while len(self._base_cache) > self.BASE_CACHE_SIZE:
+                    self._base_cache.popitem(last=False)
+
+        self._raise_if_cancelled(should_cancel)
+        resize_to = thumbnail_settings.resize_to
+        if max_dim is not None and resize_to:
+            resize_to = self._fit_box(resize_to, max_dim)
 
         if progress_callback:
             progress_callback(80)
 
-        watermarked = self.watermark_manager.apply(base_image, watermark_settings)
+        # Text watermarks render at an absolute pixel font size, so a preview
+        # composited on the downscaled base must shrink the font (and the
+        # edge margin) by the same factor to stay WYSIWYG with the saved
+        # output. Image watermarks scale relative to base width already.
+        margin = WatermarkManager.MARGIN
+        if fit_factor < 1.0:
+            if watermark_settings.kind == "text":
+                watermark_settings = replace(
+                    watermark_settings,
+                    font_size=max(8, round(watermark_settings.font_size * fit_factor)),
+                )
+            margin = max(1, round(margin * fit_factor))
+
+        watermarked = self.watermark_manager.apply(
+            base_image, watermark_settings, margin
+        )
         if progress_callback:
             progress_callback(90)
 
-        resized = self._maybe_resize(watermarked, thumbnail_settings.resize_to)
+        self._raise_if_cancelled(should_cancel)
+        resized = self._maybe_resize(watermarked, resize_to)
         return resized
 
+    @staticmethod
+    def _raise_if_cancelled(should_cancel: CancelCheck) -> None:
+        if should_cancel is not None and should_cancel():
+            raise PreviewCancelled()
+
+    @staticmethod
+    def _base_cache_key(
+        settings: ThumbnailSettings, max_dim: Optional[Tuple[int, int]]
+    ) -> Optional[tuple]:
+        """Decode-relevant fields only; None outside the preview path."""
+        if max_dim is None:
+            return None
+        return (
+            settings.mode,
+            settings.timestamp,
+            settings.rows,
+            settings.columns,
+            settings.randomize,
+            settings.random_seed,
+            max_dim,
+        )
+
     def _generate_single(
         self,
         settings: ThumbnailSettings,
@@ -91,7 +289,9 @@ class ThumbnailGenerator:
         frame = self.video_processor.extract_frame(settings.timestamp)
         if progress_callback:
             progress_callback(60)
-        return frame.convert("RGB")
+        # Decoded frames are already RGB; convert() on a matching mode would
+        # still copy the full image.
+        return frame if frame.mode == "RGB" else frame.convert("RGB")
 
     def _generate_grid(
         self,
@@ -102,6 +302,17 @@ class ThumbnailGenerator:
         cols = max(1, settings.columns)
         frame_count = rows * cols
 
+        if frame_count == 1 and not settings.randomize:
+            # A 1x1 grid is just a single frame at the midpoint; skip the
+            # frame-list and compose scaffolding (and its resize pass).
+            # Randomized 1x1 grids stay on the sampling path below so the
+            # seeded random draw keeps picking the frame.
+            duration = float(self.get_video_info().duration or 0.0)
+            return self._generate_single(
+                replace(settings, mode="single", timestamp=duration / 2.0),
+                progress_callback,
+            )
+
         def frame_progress(percent: int) -> None:
             if progress_callback:
                 progress_callback(int(percent * 0.6))
@@ -123,7 +334,8 @@ class ThumbnailGenerator:
         grid = self._compose_grid(frames, rows, cols)
         if progress_callback:
             progress_callback(70)
-        return grid.convert("RGB")
+        # _compose_grid builds the canvas in RGB directly.
+        return grid
 
     @staticmethod
     def _compose_grid(frames: List[Image.Image], rows: int, cols: int) -> Image.Image:
@@ -133,18 +345,38 @@ class ThumbnailGenerator:
         grid_width = frame_width * cols
         grid_height = frame_height * rows
 
-        grid_image = Image.new("RGB", (grid_width, grid_height))
+        # One preallocated RGB canvas; each tile lands as a vectorized slice
+        # assignment rather than a Pillow paste through the generic compositor.
+        canvas = np.zeros((grid_height, grid_width, 3), dtype=np.uint8)
 
-        for index, frame in enumerate(frames):
+        def render_tile(index: int, frame: Image.Image) -> None:
             r = index // cols
             c = index % cols
             if r >= rows:
-                break
-            resized = frame.resize((frame_width, frame_height), Image.Resampling.LANCZOS)
-            top_left = (c * frame_width, r * frame_height)
-            grid_image.paste(resized, top_left)
+                return
+            # Frames from one clip normally share a resolution; LANCZOS over
+            # an already-matching tile would be a full-cost no-op.
+            if frame.size != (frame_width, frame_height):
+                frame = frame.resize((frame_width, frame_height), Image.Resampling.LANCZOS)
+            if frame.mode != "RGB":
+                frame = frame.convert("RGB")
+            canvas[
+                r * frame_height:(r + 1) * frame_height,
+                c * frame_width:(c + 1) * frame_width,
+            ] = np.asarray(frame)
+
+        if len(frames) >= 8:
+            # Resize and blit release the GIL in their C cores, and every
+            # tile writes a disjoint canvas rectangle, so threads are safe.
+            workers = min(len(frames), os.cpu_count() or 1, 8)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() drains the iterator so worker exceptions propagate.
+                list(pool.map(render_tile, range(len(frames)), frames))
+        else:
+            for index, frame in enumerate(frames):
+                render_tile(index, frame)
 
-        return grid_image
+        return Image.fromarray(canvas, "RGB")
 
     @staticmethod
     def _ensure_output_path(settings: ThumbnailSettings) -> Path:
@@ -155,6 +387,30 @@ class ThumbnailGenerator:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         return output_path
 
+    @staticmethod
+    def _fit_within(image: Image.Image, max_dim: Tuple[int, int]) -> Image.Image:
+        """Downscale (never upscale) so the image fits inside max_dim."""
+        max_w, max_h = max_dim
+        if max_w <= 0 or max_h <= 0:
+            return image
+        scale = min(max_w / image.width, max_h / image.height)
+        if scale >= 1.0:
+            return image
+        new_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        return ThumbnailGenerator._downscale(image, new_size)
+
+    @staticmethod
+    def _fit_box(box: Tuple[int, int], max_dim: Tuple[int, int]) -> Tuple[int, int]:
+        """Scale a target box down to fit inside max_dim, keeping aspect."""
+        box_w, box_h = box
+        max_w, max_h = max_dim
+        if box_w <= 0 or box_h <= 0 or max_w <= 0 or max_h <= 0:
+            return box
+        scale = min(max_w / box_w, max_h / box_h)
+        if scale >= 1.0:
+            return box
+        return (max(1, int(box_w * scale)), max(1, int(box_h * scale)))
+
     @staticmethod
     def _maybe_resize(image: Image.Image, target_size: Optional[Tuple[int, int]]) -> Image.Image:
         if not target_size:
@@ -164,8 +420,42 @@ class ThumbnailGenerator:
         height = max(1, int(height))
         if (image.width, image.height) == (width, height):
             return image
+        if width < image.width and height < image.height:
+            return ThumbnailGenerator._downscale(image, (width, height))
         return image.resize((width, height), Image.Resampling.LANCZOS)
 
+    @staticmethod
+    def _downscale(image: Image.Image, target: Tuple[int, int]) -> Image.Image:
+        """
+        Shrink via an integer box reduce (cheap, SIMD-friendly) to near the
+        target, then a LANCZOS pass for the fractional remainder.
+        """
+        target_w, target_h = target
+        factor = max(1, min(image.width // target_w, image.height // target_h))
+        if factor > 1:
+            image = image.reduce(factor)
+        if (image.width, image.height) == (target_w, target_h):
+            return image
+        return image.resize((target_w, target_h), Image.Resampling.LANCZOS)
+
+    @staticmethod
+    def _save_kwargs(pil_format: str) -> dict:
+        """Encoder settings tuned for fast thumbnail writes."""
+        if pil_format == "JPEG":
+            # Skip the extra Huffman-optimization and progressive passes;
+            # 4:2:0 subsampling is the cheapest encode and standard here.
+            return {
+                "quality": 90,
+                "optimize": False,
+                "progressive": False,
+                "subsampling": 2,
+            }
+        if pil_format == "PNG":
+            # Level 1 deflate is several times faster than the default 6 at
+            # a modest size cost — the right trade for thumbnails.
+            return {"compress_level": 1}
+        return {}
+
     @staticmethod
     def _resolve_format(output_format: str) -> str:
         normalized = (output_format or "").strip().lower()
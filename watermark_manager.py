@@ -4,13 +4,86 @@ Watermark composition utilities for thumbnails.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
-from PIL import Image, ImageColor, ImageDraw, ImageEnhance, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _load_font_cached(font_path: Optional[str], size: int) -> ImageFont.ImageFont:
+    """Parse a font once per (path, size); TTF table construction is not free
+    and previously re-ran on every thumbnail."""
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except OSError:
+            pass
+    for candidate in ("DejaVuSans.ttf", "arial.ttf"):
+        try:
+            return ImageFont.truetype(candidate, size=size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=8)
+def _render_text_overlay(
+    text: str,
+    font_path: Optional[str],
+    font_size: int,
+    color: Tuple[int, int, int],
+    opacity: int,
+) -> Optional[Image.Image]:
+    """Rasterize a text stamp once per styling combination.
+
+    Scrubbing and watermark-position tweaks re-render the identical glyphs
+    every pass; caching the bbox-sized RGBA overlay makes those renders a
+    dict hit. Callers must not mutate the returned image.
+    """
+    font = _load_font_cached(font_path, max(8, font_size))
+    # The font computes its own bbox; no throwaway canvas/draw context needed.
+    text_bbox = font.getbbox(text)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+    if text_width <= 0 or text_height <= 0:
+        return None
+
+    pad = 2
+    overlay = Image.new(
+        "RGBA", (text_width + 2 * pad, text_height + 2 * pad), (0, 0, 0, 0)
+    )
+    draw = ImageDraw.Draw(overlay)
+    rgba_color = (*color, int(255 * (opacity / 100.0)))
+    draw.text(
+        (pad - text_bbox[0], pad - text_bbox[1]), text, fill=rgba_color, font=font
+    )
+    return overlay
+
+
+@lru_cache(maxsize=8)
+def _load_scaled_watermark(path: str, mtime_ns: int, target_width: int) -> Image.Image:
+    """Decode and resize a watermark image once per (file, size) pair.
+
+    Opacity is applied by the caller on a copy, so the cached RGBA source
+    stays pristine across renders; mtime keys invalidation.
+    """
+    watermark = Image.open(path)
+    # For JPEG sources draft() asks libjpeg for a cheap DCT-domain 1/2-1/8
+    # decode near the target size; it is a no-op for other formats.
+    watermark.draft("RGB", (target_width, target_width))
+    watermark = watermark.convert("RGBA")
+    scale_factor = target_width / watermark.width
+    new_size = (
+        max(1, int(watermark.width * scale_factor)),
+        max(1, int(watermark.height * scale_factor)),
+    )
+    return watermark.resize(new_size, Image.Resampling.LANCZOS)
+
+
+@dataclass(frozen=True, slots=True)
 class WatermarkSettings:
     kind: str  # "none", "text", "image"
     opacity: int = 50  # 0-100
@@ -38,90 +111,129 @@ class WatermarkManager:
         "bottom-right": (0.95, 0.95),
     }
 
-    def apply(self, base_image: Image.Image, settings: WatermarkSettings) -> Image.Image:
+    # Edge margin the overlay is kept away from, in base-image pixels.
+    MARGIN = 16
+
+    def apply(
+        self,
+        base_image: Image.Image,
+        settings: WatermarkSettings,
+        margin: int = MARGIN,
+    ) -> Image.Image:
         if settings.kind == "none":
             return base_image
 
         if settings.opacity <= 0:
             return base_image
 
-        watermark_layer = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-
         if settings.kind == "text":
-            overlay = self._create_text_watermark(base_image.size, settings)
+            placed = self._create_text_watermark(base_image.size, settings, margin)
         elif settings.kind == "image":
-            overlay = self._create_image_watermark(base_image.size, settings)
+            placed = self._create_image_watermark(base_image.size, settings, margin)
         else:
             return base_image
 
-        if overlay is None:
+        if placed is None:
             return base_image
 
-        watermark_layer.alpha_composite(overlay)
-
-        combined = Image.alpha_composite(
-            base_image.convert("RGBA"),
-            watermark_layer,
-        )
+        # Composite only the overlay-sized region: allocating and blending a
+        # full-frame RGBA layer touched base_w*base_h pixels for what is
+        # usually a small stamp.
+        overlay, top_left = placed
+        if settings.opacity >= 100 and base_image.mode == "RGB":
+            # Full-opacity stamp over an opaque base: paste with the overlay's
+            # own alpha as mask, skipping the RGB->RGBA->RGB round-trip
+            # (paste clips out-of-bounds regions itself).
+            combined = base_image.copy()
+            combined.paste(overlay, top_left, overlay)
+            return combined
+        combined = base_image.convert("RGBA")
+        self._paste_overlay(combined, overlay, top_left)
         return combined.convert("RGB")
 
-    def _create_text_watermark(
-        self, base_size: Tuple[int, int], settings: WatermarkSettings
-    ) -> Optional[Image.Image]:
-        if not settings.text.strip():
-            return None
-
-        overlay = Image.new("RGBA", base_size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+    @staticmethod
+    def _paste_overlay(
+        base_rgba: Image.Image, overlay: Image.Image, top_left: Tuple[int, int]
+    ) -> None:
+        """alpha_composite the overlay in place, cropping anything that
+        would fall outside the base (dest must be non-negative)."""
+        x, y = top_left
+        left = max(0, -x)
+        top = max(0, -y)
+        right = min(overlay.width, base_rgba.width - x)
+        bottom = min(overlay.height, base_rgba.height - y)
+        if right <= left or bottom <= top:
+            return
+        if (left, top, right, bottom) != (0, 0, overlay.width, overlay.height):
+            overlay = overlay.crop((left, top, right, bottom))
+            x = max(0, x)
+            y = max(0, y)
+        base_rgba.alpha_composite(overlay, dest=(x, y))
 
-        font = self._load_font(settings)
+    def _create_text_watermark(
+        self,
+        base_size: Tuple[int, int],
+        settings: WatermarkSettings,
+        margin: int = MARGIN,
+    ) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
         text = settings.text.strip()
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
-
-        center = self._resolve_center(base_size, (text_width, text_height), settings)
-        center = self._constrain_center(center, base_size, (text_width, text_height))
+        if not text:
+            return None
 
-        color = self._resolve_color(settings.color)
-        opacity = max(0, min(settings.opacity, 100))
-        rgba_color = (*color, int(255 * (opacity / 100.0)))
+        font_path = None
+        if settings.font_path and Path(settings.font_path).exists():
+            font_path = str(settings.font_path)
+        overlay = _render_text_overlay(
+            text,
+            font_path,
+            settings.font_size,
+            self._resolve_color(settings.color),
+            max(0, min(settings.opacity, 100)),
+        )
+        if overlay is None:
+            return None
 
-        draw.text(center, text, fill=rgba_color, font=font, anchor="mm")
-        return overlay
+        center = self._resolve_center(base_size, overlay.size, settings)
+        center = self._constrain_center(center, base_size, overlay.size, margin)
+        top_left = (center[0] - overlay.width // 2, center[1] - overlay.height // 2)
+        return overlay, top_left
 
     def _create_image_watermark(
-        self, base_size: Tuple[int, int], settings: WatermarkSettings
-    ) -> Optional[Image.Image]:
-        if not settings.image_path or not Path(settings.image_path).exists():
+        self,
+        base_size: Tuple[int, int],
+        settings: WatermarkSettings,
+        margin: int = MARGIN,
+    ) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
+        image_path = Path(settings.image_path) if settings.image_path else None
+        if image_path is None:
+            return None
+        try:
+            mtime_ns = image_path.stat().st_mtime_ns
+        except OSError:
             return None
-
-        overlay = Image.new("RGBA", base_size, (0, 0, 0, 0))
-        watermark = Image.open(settings.image_path).convert("RGBA")
 
         target_width = int(base_size[0] * max(0.05, min(settings.scale, 1.0)))
         if target_width <= 0:
             return None
 
-        scale_factor = target_width / watermark.width
-        new_size = (
-            max(1, int(watermark.width * scale_factor)),
-            max(1, int(watermark.height * scale_factor)),
-        )
-        watermark = watermark.resize(new_size, Image.Resampling.LANCZOS)
+        watermark = _load_scaled_watermark(str(image_path), mtime_ns, target_width)
 
         opacity = max(0, min(settings.opacity, 100))
         if opacity < 100:
-            alpha = watermark.getchannel("A")
-            alpha = ImageEnhance.Brightness(alpha).enhance(opacity / 100.0)
-            watermark.putalpha(alpha)
+            # One vectorized multiply over the alpha channel; the uint16
+            # intermediate avoids uint8 overflow and replaces ImageEnhance's
+            # object + lookup-table construction per render.
+            watermark = watermark.copy()
+            alpha = np.asarray(watermark.getchannel("A"), dtype=np.uint16)
+            scaled = ((alpha * (opacity * 255 // 100)) // 255).astype(np.uint8)
+            watermark.putalpha(
+                Image.frombuffer("L", watermark.size, scaled, "raw", "L", 0, 1)
+            )
 
         center = self._resolve_center(base_size, watermark.size, settings)
-        center = self._constrain_center(center, base_size, watermark.size)
+        center = self._constrain_center(center, base_size, watermark.size, margin)
         top_left = (center[0] - watermark.width // 2, center[1] - watermark.height // 2)
-
-        overlay.alpha_composite(watermark, dest=top_left)
-        return overlay
+        return watermark, top_left
 
     @staticmethod
     def _resolve_color(color: str) -> Tuple[int, int, int]:
@@ -130,22 +242,6 @@ class WatermarkManager:
         except ValueError:
             return 255, 255, 255
 
-    def _load_font(self, settings: WatermarkSettings) -> ImageFont.FreeTypeFont:
-        if settings.font_path and Path(settings.font_path).exists():
-            try:
-                return ImageFont.truetype(
-                    str(settings.font_path), size=max(8, settings.font_size)
-                )
-            except OSError:
-                pass
-        size = max(8, settings.font_size)
-        for candidate in ("DejaVuSans.ttf", "arial.ttf"):
-            try:
-                return ImageFont.truetype(candidate, size=size)
-            except OSError:
-                continue
-        return ImageFont.load_default()
-
     def _resolve_center(
         self,
         base_size: Tuple[int, int],
@@ -169,8 +265,10 @@ class WatermarkManager:
         base_w, base_h = base_size
         overlay_w, overlay_h = overlay_size
 
-        half_w = overlay_w / 2
-        half_h = overlay_h / 2
+        # Pure integer arithmetic; the float half-dims and min/max chains
+        # cost real time when overlays are clamped per tile.
+        half_w = overlay_w // 2
+        half_h = overlay_h // 2
 
         min_x = margin + half_w
         max_x = base_w - margin - half_w
@@ -178,10 +276,11 @@ class WatermarkManager:
         max_y = base_h - margin - half_h
 
         if min_x > max_x:
-            min_x = max_x = base_w / 2
+            min_x = max_x = base_w // 2
         if min_y > max_y:
-            min_y = max_y = base_h / 2
+            min_y = max_y = base_h // 2
 
-        constrained_x = int(max(min(center[0], max_x), min_x))
-        constrained_y = int(max(min(center[1], max_y), min_y))
+        x, y = center
+        constrained_x = min_x if x < min_x else (max_x if x > max_x else x)
+        constrained_y = min_y if y < min_y else (max_y if y > max_y else y)
         return constrained_x, constrained_y